@@ -9,6 +9,7 @@ Prerequisites:
 3. Run this demo: python demo.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from hmac_client import HmacClient
 import json
 
@@ -23,59 +24,70 @@ def demonstrate_hmac_authentication():
         base_url="https://localhost:7134"   # API base URL
     )
 
+    new_user = {
+        "first": "Demo",
+        "last": "User",
+        "email": "demo.user@example.com"
+    }
+
     try:
-        print("1. Testing public endpoint (Hello World)...")
-        hello_response = client.get("/")
-        print(f"   Status: {hello_response.status_code}")
-        print(f"   Response: {hello_response.text}\n")
-
-        print("2. Testing public endpoint (Weather data)...")
-        weather_response = client.get("/weather")
-        print(f"   Status: {weather_response.status_code}")
-        if weather_response.status_code == 200:
-            weather_data = weather_response.json()
-            print(f"   Weather count: {len(weather_data)} items\n")
-        else:
-            print(f"   Error: {weather_response.text}\n")
-
-        print("3. Testing authenticated endpoint (Users)...")
-        users_response = client.get("/users")
-
-        if users_response.status_code == 200:
-            users_data = users_response.json()
-            print(f"   Status: {users_response.status_code} (Authentication successful!)")
-            print(f"   Users count: {len(users_data)} items\n")
-        else:
-            print(f"   Status: {users_response.status_code} (Authentication failed)")
-            print(f"   Error: {users_response.text}\n")
-
-        print("4. Testing authenticated POST endpoint (Create User)...")
-        new_user = {
-            "first": "Demo",
-            "last": "User",
-            "email": "demo.user@example.com"
-        }
-
-        create_user_response = client.post("/users", new_user)
-
-        if create_user_response.status_code == 200:
-            created_user = create_user_response.json()
-            print(f"   Status: {create_user_response.status_code} (Authentication successful!)")
-            print(f"   Created user: {created_user.get('firstName', 'N/A')} {created_user.get('lastName', 'N/A')}\n")
-        else:
-            print(f"   Status: {create_user_response.status_code} (Authentication failed)")
-            print(f"   Error: {create_user_response.text}\n")
-
-        print("5. Testing authenticated endpoint (Addresses)...")
-        addresses_response = client.get("/addresses")
-
-        if addresses_response.status_code == 200:
-            addresses_data = addresses_response.json()
-            print(f"   Status: {addresses_response.status_code} (Authentication successful!)")
-            print(f"   Addresses count: {len(addresses_data)} items\n")
-        else:
-            print(f"   Status: {addresses_response.status_code} (Authentication failed)")
-            print(f"   Error: {addresses_response.text}\n")
+        # The requests are independent, so send them concurrently over the client's
+        # shared connection pool and report the results in order
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                "hello": executor.submit(client.get, "/"),
+                "weather": executor.submit(client.get, "/weather"),
+                "users": executor.submit(client.get, "/users"),
+                "create_user": executor.submit(client.post, "/users", new_user),
+                "addresses": executor.submit(client.get, "/addresses")
+            }
+
+            print("1. Testing public endpoint (Hello World)...")
+            hello_response = futures["hello"].result()
+            print(f"   Status: {hello_response.status_code}")
+            print(f"   Response: {hello_response.text}\n")
+
+            print("2. Testing public endpoint (Weather data)...")
+            weather_response = futures["weather"].result()
+            print(f"   Status: {weather_response.status_code}")
+            if weather_response.status_code == 200:
+                weather_data = weather_response.json()
+                print(f"   Weather count: {len(weather_data)} items\n")
+            else:
+                print(f"   Error: {weather_response.text}\n")
+
+            print("3. Testing authenticated endpoint (Users)...")
+            users_response = futures["users"].result()
+
+            if users_response.status_code == 200:
+                users_data = users_response.json()
+                print(f"   Status: {users_response.status_code} (Authentication successful!)")
+                print(f"   Users count: {len(users_data)} items\n")
+            else:
+                print(f"   Status: {users_response.status_code} (Authentication failed)")
+                print(f"   Error: {users_response.text}\n")
+
+            print("4. Testing authenticated POST endpoint (Create User)...")
+            create_user_response = futures["create_user"].result()
+
+            if create_user_response.status_code == 200:
+                created_user = create_user_response.json()
+                print(f"   Status: {create_user_response.status_code} (Authentication successful!)")
+                print(f"   Created user: {created_user.get('firstName', 'N/A')} {created_user.get('lastName', 'N/A')}\n")
+            else:
+                print(f"   Status: {create_user_response.status_code} (Authentication failed)")
+                print(f"   Error: {create_user_response.text}\n")
+
+            print("5. Testing authenticated endpoint (Addresses)...")
+            addresses_response = futures["addresses"].result()
+
+            if addresses_response.status_code == 200:
+                addresses_data = addresses_response.json()
+                print(f"   Status: {addresses_response.status_code} (Authentication successful!)")
+                print(f"   Addresses count: {len(addresses_data)} items\n")
+            else:
+                print(f"   Status: {addresses_response.status_code} (Authentication failed)")
+                print(f"   Error: {addresses_response.text}\n")
 
     except Exception as error:
         print(f"Demo failed: {str(error)}")
@@ -5,12 +5,79 @@ Based on HashGate.AspNetCore implementation
 
 import hashlib
 import hmac
-import base64
+import json
 import time
 import uuid
-from urllib.parse import urlparse, urlencode
-from typing import Optional, Dict, Any, List
+import warnings
+from binascii import b2a_base64
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Union
 import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import httpx
+
+# requests.Response, or httpx.Response when the client is created with http2=True
+ClientResponse = Union[requests.Response, "httpx.Response"]
+
+
+def is_openssl_sha256() -> bool:
+    """
+    Checks whether hashlib's SHA-256 is backed by OpenSSL 1.1 or newer
+
+    OpenSSL provides the hardware accelerated (SHA-NI / ARMv8 crypto) SHA-256
+    implementation; the builtin fallback is plain C and considerably slower.
+
+    Returns:
+        True if SHA-256 and HMAC run through OpenSSL 1.1+, otherwise False
+    """
+    if getattr(hashlib.sha256, '__name__', '') != 'openssl_sha256':
+        return False
+
+    try:
+        import ssl
+    except ImportError:
+        return False
+
+    return ssl.OPENSSL_VERSION_INFO >= (1, 1)
+
+
+def _build_sign_input_py(method: bytes, path_and_query: bytes, host: bytes, timestamp: bytes,
+                         content_hash: bytes, nonce: bytes) -> bytes:
+    """
+    Pure-Python fallback for _fast.build_sign_input
+    """
+    return b"\n".join([method, path_and_query, b";".join([host, timestamp, content_hash, nonce])])
+
+
+def _b64_32_py(digest: bytes) -> bytes:
+    """
+    Pure-Python fallback for _fast.b64_32
+    """
+    return b2a_base64(digest, newline=False)
+
+
+try:
+    # Optional compiled helpers, build with: cythonize -i _fast.pyx
+    from _fast import build_sign_input as _build_sign_input, b64_32 as _b64_32
+    HAS_FAST_PATH = True
+except ImportError:
+    _build_sign_input = _build_sign_input_py
+    _b64_32 = _b64_32_py
+    HAS_FAST_PATH = False
+
+try:
+    # Optional OpenSSL-backed SHA-256/HMAC, used with crypto_backend='cryptography'
+    from cryptography.hazmat.primitives import hashes as crypto_hashes, hmac as crypto_hmac
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    crypto_hashes = None
+    crypto_hmac = None
+    HAS_CRYPTOGRAPHY = False
+
+# urllib3's InsecureRequestWarning filter is process-wide, only install it once
+_WARNINGS_DISABLED = False
 
 
 class HmacClient:
@@ -29,7 +96,14 @@ class HmacClient:
     EMPTY_CONTENT_HASH = "47DEQpj8HBSa+/TImW+5JCeuQeRkm5NMpJWZG3hSuFU="
     DEFAULT_SIGNED_HEADERS = ["host", TIME_STAMP_HEADER_NAME, CONTENT_HASH_HEADER_NAME, NONCE_HEADER_NAME]
 
-    def __init__(self, client: str, secret: str, base_url: str = "https://localhost:7134"):
+    CRYPTO_BACKENDS = ("hashlib", "cryptography")
+
+    # Bodies larger than this are hashed incrementally in HASH_CHUNK_SIZE slices
+    LARGE_CONTENT_SIZE = 1 << 20
+    HASH_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, client: str, secret: str, base_url: str = "https://localhost:7134", http2: bool = False,
+                 crypto_backend: str = "hashlib"):
         """
         Initialize HMAC client
 
@@ -37,17 +111,86 @@ class HmacClient:
             client: The client identifier
             secret: The secret key for HMAC signing
             base_url: The base URL of the API
+            http2: Send requests with httpx over HTTP/2 (requires the optional httpx[http2] package)
+            crypto_backend: 'hashlib' or 'cryptography' (requires the optional cryptography package)
         """
+        if crypto_backend not in self.CRYPTO_BACKENDS:
+            raise ValueError(f"crypto_backend must be one of {self.CRYPTO_BACKENDS}, got {crypto_backend!r}")
+        if crypto_backend == "cryptography" and not HAS_CRYPTOGRAPHY:
+            raise ImportError("crypto_backend='cryptography' requires cryptography: pip install cryptography")
+
         self.client = client
         self.secret = secret.encode('utf-8')
+        self.crypto_backend = crypto_backend
+        self._use_cryptography = crypto_backend == "cryptography"
+
+        # Keyed HMAC state (ipad/opad already absorbed), copied per signature
+        if self._use_cryptography:
+            self._hmac_template = crypto_hmac.HMAC(self.secret, crypto_hashes.SHA256())
+        else:
+            self._hmac_template = hmac.new(self.secret, None, hashlib.sha256)
+
         self.base_url = base_url.rstrip('/')  # Remove trailing slash
-        self.session = requests.Session()
+
+        # Authorization header up to the signature is the same for every request
+        self._signed_headers_str = ";".join(self.DEFAULT_SIGNED_HEADERS)
+        self._auth_prefix = f"{self.DEFAULT_SCHEME_NAME} Client={self.client}&SignedHeaders={self._signed_headers_str}&Signature="
+        self._empty_content_hash_bytes = self.EMPTY_CONTENT_HASH.encode('ascii')
+
+        # base_url is fixed, so parse it once instead of per request
+        parsed = urlparse(self.base_url)
+        self._host = parsed.netloc
+        self._host_bytes = self._host.encode('utf-8')
+        self._base_path_prefix = parsed.path.rstrip('/')
+
+        # Pre-sized headers template, copied and filled in per request
+        self._headers_tpl = {
+            "Host": self._host,
+            self.TIME_STAMP_HEADER_NAME: "",
+            self.CONTENT_HASH_HEADER_NAME: "",
+            self.NONCE_HEADER_NAME: "",
+            "Authorization": "",
+            "Content-Type": "application/json"
+        }
+
+        if not self._use_cryptography and ('sha256' not in hashlib.algorithms_available or not is_openssl_sha256()):
+            warnings.warn(
+                "hashlib SHA-256 is not backed by OpenSSL 1.1+; hashing will not use "
+                "hardware acceleration. Install a Python linked against a modern OpenSSL "
+                "or use crypto_backend='cryptography'.",
+                RuntimeWarning,
+                stacklevel=2
+            )
 
         # Disable SSL verification for development (localhost)
-        if "localhost" in base_url or "127.0.0.1" in base_url:
-            self.session.verify = False
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        verify = not ("localhost" in base_url or "127.0.0.1" in base_url)
+
+        # Optional HTTP/2 transport, multiplexes requests over a single TLS connection
+        self.session = None
+        self._http2_client = None
+        if http2:
+            try:
+                import httpx
+            except ImportError as error:
+                raise ImportError("http2=True requires httpx: pip install 'httpx[http2]'") from error
+
+            self._http2_client = httpx.Client(http2=True, verify=verify)
+        else:
+            self.session = requests.Session()
+
+            # Larger keep-alive pool so bursts of requests reuse connections (and TLS sessions)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, pool_block=False)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+            if not verify:
+                self.session.verify = False
+
+                global _WARNINGS_DISABLED
+                if not _WARNINGS_DISABLED:
+                    import urllib3
+                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                    _WARNINGS_DISABLED = True
 
     def create_string_to_sign(self, method: str, path_and_query: str, header_values: List[str]) -> str:
         """
@@ -65,22 +208,37 @@ class HmacClient:
         header_string = ";".join(header_values)
         return f"{upper_method}\n{path_and_query}\n{header_string}"
 
-    def generate_signature(self, string_to_sign: str) -> str:
+    def generate_signature(self, string_to_sign: Union[str, bytes]) -> str:
         """
         Generates HMAC-SHA256 signature for the string to sign
 
         Args:
-            string_to_sign: The canonical string to sign
+            string_to_sign: The canonical string to sign (str or UTF-8 encoded bytes)
 
         Returns:
             Base64-encoded signature
         """
-        signature = hmac.new(
-            self.secret,
-            string_to_sign.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
-        return base64.b64encode(signature).decode('utf-8')
+        if isinstance(string_to_sign, str):
+            string_to_sign = string_to_sign.encode('utf-8')
+
+        h = self._hmac_template.copy()
+        h.update(string_to_sign)
+        signature = h.finalize() if self._use_cryptography else h.digest()
+        return _b64_32(signature).decode('ascii')
+
+    def _sign_request(self, method: bytes, path_and_query: bytes, timestamp: bytes,
+                      content_hash: bytes, nonce: bytes) -> str:
+        """
+        Signs the canonical request from a copy of the keyed HMAC state
+
+        Returns:
+            Base64-encoded signature
+        """
+        h = self._hmac_template.copy()
+        h.update(_build_sign_input(method, path_and_query, self._host_bytes, timestamp, content_hash, nonce))
+
+        signature = h.finalize() if self._use_cryptography else h.digest()
+        return _b64_32(signature).decode('ascii')
 
     def generate_authorization_header(self, signed_headers: List[str], signature: str) -> str:
         """
@@ -93,15 +251,18 @@ class HmacClient:
         Returns:
             Authorization header value
         """
+        if signed_headers is self.DEFAULT_SIGNED_HEADERS:
+            return self._auth_prefix + signature
+
         signed_headers_string = ";".join(signed_headers)
         return f"{self.DEFAULT_SCHEME_NAME} Client={self.client}&SignedHeaders={signed_headers_string}&Signature={signature}"
 
-    def calculate_content_hash(self, content: Optional[str]) -> str:
+    def calculate_content_hash(self, content: Optional[bytes]) -> str:
         """
         Calculates SHA256 hash of content and returns base64-encoded result
 
         Args:
-            content: Content to hash (None for empty content)
+            content: UTF-8 encoded content to hash (None for empty content)
 
         Returns:
             Base64-encoded SHA256 hash
@@ -109,28 +270,46 @@ class HmacClient:
         if not content:
             return self.EMPTY_CONTENT_HASH
 
-        content_bytes = content.encode('utf-8')
-        hash_digest = hashlib.sha256(content_bytes).digest()
-        return base64.b64encode(hash_digest).decode('utf-8')
-
-    def create_authenticated_headers(self, method: str, path: str, content: Optional[str] = None) -> Dict[str, str]:
+        view = memoryview(content)
+
+        if self._use_cryptography:
+            h = crypto_hashes.Hash(crypto_hashes.SHA256())
+            for offset in range(0, len(view), self.HASH_CHUNK_SIZE):
+                h.update(view[offset:offset + self.HASH_CHUNK_SIZE])
+            hash_digest = h.finalize()
+        elif len(view) <= self.LARGE_CONTENT_SIZE:
+            hash_digest = hashlib.sha256(view).digest()
+        else:
+            # Slices of a memoryview are zero-copy; hashlib releases the GIL for each chunk
+            h = hashlib.sha256()
+            for offset in range(0, len(view), self.HASH_CHUNK_SIZE):
+                h.update(view[offset:offset + self.HASH_CHUNK_SIZE])
+            hash_digest = h.digest()
+        return _b64_32(hash_digest).decode('ascii')
+
+    def create_authenticated_headers(self, method: str, path: str, content: Optional[bytes] = None) -> Dict[str, str]:
         """
         Creates authenticated request headers
 
         Args:
             method: HTTP method
             path: Request path with query string
-            content: Request body content
+            content: UTF-8 encoded request body content
 
         Returns:
             Headers dictionary with authentication
         """
-        url = urlparse(self.base_url + path)
-        host = url.netloc
-        path_and_query = url.path + ("?" + url.query if url.query else "")
+        # path already carries the query string, so only the base path needs prefixing.
+        # Fragments and an empty trailing "?" are never sent to the server and must not be signed either.
+        if "#" in path or path.endswith("?"):
+            path = path.partition("#")[0]
+            base_path, separator, query = path.partition("?")
+            if separator and not query:
+                path = base_path
+        path_and_query = self._base_path_prefix + path
 
         # Generate timestamp (Unix timestamp)
-        timestamp = str(int(time.time()))
+        timestamp = str(time.time_ns() // 1_000_000_000)
 
         # Calculate content hash
         content_hash = self.calculate_content_hash(content)
@@ -138,34 +317,32 @@ class HmacClient:
         # Generate nonce (unique per-request value)
         nonce = str(uuid.uuid4())
 
-        # Create header values in the order of DEFAULT_SIGNED_HEADERS
-        header_values = [host, timestamp, content_hash, nonce]
-
-        # Create string to sign
-        string_to_sign = self.create_string_to_sign(method, path_and_query, header_values)
-
-        # Generate signature
-        signature = self.generate_signature(string_to_sign)
+        # Sign the canonical string, header values in the order of DEFAULT_SIGNED_HEADERS
+        signature = self._sign_request(
+            method.upper().encode('ascii'),
+            path_and_query.encode('utf-8'),
+            timestamp.encode('ascii'),
+            content_hash.encode('ascii') if content else self._empty_content_hash_bytes,
+            nonce.encode('ascii')
+        )
 
         # Generate authorization header
         authorization_header = self.generate_authorization_header(self.DEFAULT_SIGNED_HEADERS, signature)
 
         # Build final headers
-        headers = {
-            "Host": host,
-            self.TIME_STAMP_HEADER_NAME: timestamp,
-            self.CONTENT_HASH_HEADER_NAME: content_hash,
-            self.NONCE_HEADER_NAME: nonce,
-            "Authorization": authorization_header
-        }
+        headers = self._headers_tpl.copy()
+        headers[self.TIME_STAMP_HEADER_NAME] = timestamp
+        headers[self.CONTENT_HASH_HEADER_NAME] = content_hash
+        headers[self.NONCE_HEADER_NAME] = nonce
+        headers["Authorization"] = authorization_header
 
-        # Add content-type for requests with content
-        if content:
-            headers["Content-Type"] = "application/json"
+        # Content-type only applies to requests with content
+        if not content:
+            del headers["Content-Type"]
 
         return headers
 
-    def request(self, method: str, path: str, json_data: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def request(self, method: str, path: str, json_data: Optional[Dict[str, Any]] = None) -> ClientResponse:
         """
         Makes an authenticated HTTP request
 
@@ -175,14 +352,25 @@ class HmacClient:
             json_data: Request body as dictionary (will be JSON serialized)
 
         Returns:
-            requests.Response object
+            requests.Response object (httpx.Response when http2 is enabled)
         """
-        import json
-        content = json.dumps(json_data) if json_data else None
+        # Serialize once; the same bytes are hashed and sent on the wire.
+        # The body is passed as a single buffer rather than streamed: the content hash
+        # has to be in the headers before any of the body is sent, so hashing cannot
+        # overlap the upload, and urllib3 hands a bytes body to sendall() without copying.
+        content = None if json_data is None else json.dumps(json_data, separators=(',', ':')).encode('utf-8')
         headers = self.create_authenticated_headers(method, path, content)
 
         url = self.base_url + path
 
+        if self._http2_client is not None:
+            return self._http2_client.request(
+                method.upper(),
+                url,
+                headers=headers,
+                content=content
+            )
+
         response = self.session.request(
             method=method.upper(),
             url=url,
@@ -192,7 +380,7 @@ class HmacClient:
 
         return response
 
-    def get(self, path: str) -> requests.Response:
+    def get(self, path: str) -> ClientResponse:
         """
         Makes a GET request
 
@@ -200,11 +388,11 @@ class HmacClient:
             path: Request path
 
         Returns:
-            requests.Response object
+            requests.Response object (httpx.Response when http2 is enabled)
         """
         return self.request("GET", path, None)
 
-    def post(self, path: str, json_data: Dict[str, Any]) -> requests.Response:
+    def post(self, path: str, json_data: Dict[str, Any]) -> ClientResponse:
         """
         Makes a POST request
 
@@ -213,11 +401,11 @@ class HmacClient:
             json_data: Request body as dictionary
 
         Returns:
-            requests.Response object
+            requests.Response object (httpx.Response when http2 is enabled)
         """
         return self.request("POST", path, json_data)
 
-    def put(self, path: str, json_data: Dict[str, Any]) -> requests.Response:
+    def put(self, path: str, json_data: Dict[str, Any]) -> ClientResponse:
         """
         Makes a PUT request
 
@@ -226,11 +414,11 @@ class HmacClient:
             json_data: Request body as dictionary
 
         Returns:
-            requests.Response object
+            requests.Response object (httpx.Response when http2 is enabled)
         """
         return self.request("PUT", path, json_data)
 
-    def delete(self, path: str) -> requests.Response:
+    def delete(self, path: str) -> ClientResponse:
         """
         Makes a DELETE request
 
@@ -238,6 +426,6 @@ class HmacClient:
             path: Request path
 
         Returns:
-            requests.Response object
+            requests.Response object (httpx.Response when http2 is enabled)
         """
         return self.request("DELETE", path, None)
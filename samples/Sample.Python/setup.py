@@ -43,6 +43,35 @@ def check_dependencies():
     return True
 
 
+def check_crypto_backend():
+    """Check if SHA-256 is backed by a modern OpenSSL"""
+    print("\nChecking crypto backend...")
+
+    import ssl
+    from hmac_client import is_openssl_sha256
+
+    if not is_openssl_sha256():
+        print(f"⚠️  hashlib SHA-256 is not backed by OpenSSL 1.1+ ({ssl.OPENSSL_VERSION})")
+        print("   Hashing will work, but without hardware acceleration (SHA-NI).")
+        print("   Consider a Python build linked against a modern OpenSSL, or:")
+        print("   pip install cryptography")
+    else:
+        print(f"✅ hashlib SHA-256 is backed by {ssl.OPENSSL_VERSION}")
+
+    if importlib.util.find_spec('cryptography') is not None:
+        print("✅ cryptography is installed (optional)")
+
+    from hmac_client import HAS_FAST_PATH
+
+    if HAS_FAST_PATH:
+        print("✅ Compiled _fast helpers are in use (optional)")
+    else:
+        print("ℹ️  Compiled _fast helpers not built, using pure-Python path (optional)")
+        print("   Build with: cythonize -i _fast.pyx")
+
+    return True
+
+
 def test_hmac_client():
     """Test basic functionality of the HMAC client"""
     print("\nTesting HMAC client...")
@@ -86,6 +115,10 @@ def main():
     if not check_dependencies():
         success = False
 
+    # Check crypto backend (informational only)
+    if success:
+        check_crypto_backend()
+
     # Test HMAC client
     if not test_hmac_client():
         success = False
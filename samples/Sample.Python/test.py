@@ -4,9 +4,55 @@ Run with: python test.py
 """
 
 import unittest
-from unittest.mock import patch, Mock
-from hmac_client import HmacClient
+from unittest.mock import patch
+import hmac_client
+from hmac_client import HmacClient, is_openssl_sha256
 import time
+import base64
+import hashlib
+import types
+
+
+# Known-answer vectors, cross-checked with `openssl dgst -sha256 [-hmac test-secret]`
+KAT_STRING_TO_SIGN = "GET\n/api/test\nexample.com;1234567890;abc123"
+KAT_SIGNATURE = "3qx8Co+iDij225IxMwfzAybbfeoUNDEukHR3zU6MjpE="
+KAT_CONTENT = b'{"test": "data"}'
+KAT_CONTENT_HASH = "QLYf4bFa8KTVQCc1smND6M+KBF9NgXEOYQiiHZHq82Y="
+KAT_POST_CONTENT_HASH = "5Dq88zdSRIOcAS+WM/lYYtIyqVsA1bxzSLMJi5/tfzI="
+KAT_POST_SIGNATURE = "F9N3aEDz7vbye6BNFy6PlT+yIx2rZq40lvxbBV7qBvA="
+KAT_NONCE = "00000000-0000-0000-0000-000000000000"
+
+
+class _StubResponse:
+    """Minimal response returned by _StubSession"""
+    status_code = 200
+
+
+class _StubSession:
+    """Lightweight stand-in for requests.Session that records the last request"""
+
+    def __init__(self):
+        self.calls = 0
+        self.last = None
+
+    def request(self, **kwargs):
+        self.calls += 1
+        self.last = kwargs
+        return _StubResponse()
+
+
+class _StubHttp2Client:
+    """Lightweight stand-in for httpx.Client that records the last request"""
+
+    def __init__(self, **kwargs):
+        self.options = kwargs
+        self.calls = 0
+        self.last = None
+
+    def request(self, *args, **kwargs):
+        self.calls += 1
+        self.last = (args, kwargs)
+        return _StubResponse()
 
 
 class TestHmacClient(unittest.TestCase):
@@ -18,6 +64,9 @@ class TestHmacClient(unittest.TestCase):
             secret="test-secret",
             base_url="https://api.example.com"
         )
+        # Keep the real session for adapter tests, send requests to a stub
+        self.session = self.client.session
+        self.client.session = _StubSession()
 
     def test_initialization(self):
         """Test client initialization"""
@@ -25,11 +74,140 @@ class TestHmacClient(unittest.TestCase):
         self.assertEqual(self.client.secret, b"test-secret")
         self.assertEqual(self.client.base_url, "https://api.example.com")
 
+    def test_session_connection_pool(self):
+        """Test that the session mounts a pooled adapter"""
+        adapter = self.session.get_adapter("https://api.example.com/api/test")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertIs(adapter, self.session.get_adapter("http://api.example.com/"))
+
+    def test_http2_requires_httpx(self):
+        """Test that HTTP/2 mode reports a missing httpx dependency"""
+        with patch.dict('sys.modules', {'httpx': None}):
+            with self.assertRaises(ImportError):
+                HmacClient("test", "secret", "https://api.example.com", http2=True)
+
+    def test_http2_request(self):
+        """Test that HTTP/2 mode sends the hashed bytes through the httpx client"""
+        with patch.dict('sys.modules', {'httpx': types.SimpleNamespace(Client=_StubHttp2Client)}):
+            client = HmacClient("TestClient", "test-secret", "https://localhost:7134", http2=True)
+
+        self.assertIsNone(client.session)
+        self.assertEqual(client._http2_client.options, {"http2": True, "verify": False})
+
+        response = client.post("/api/test", {"key": "value"})
+
+        self.assertIsInstance(response, _StubResponse)
+        self.assertEqual(client._http2_client.calls, 1)
+        args, kwargs = client._http2_client.last
+        self.assertEqual(args, ("POST", "https://localhost:7134/api/test"))
+        self.assertEqual(kwargs['content'], b'{"key":"value"}')
+
+        # Hash must cover exactly the bytes sent on the wire
+        expected_hash = client.calculate_content_hash(kwargs['content'])
+        self.assertEqual(kwargs['headers']['x-content-sha256'], expected_hash)
+
+    def test_invalid_crypto_backend(self):
+        """Test that an unknown crypto backend is rejected"""
+        with self.assertRaises(ValueError):
+            HmacClient("test", "secret", "https://api.example.com", crypto_backend="md5")
+
+    @unittest.skipUnless(hmac_client.HAS_CRYPTOGRAPHY, "Requires the cryptography package")
+    def test_cryptography_backend(self):
+        """Test that the cryptography backend matches the hashlib backend"""
+        client = HmacClient("TestClient", "test-secret", "https://api.example.com", crypto_backend="cryptography")
+        string_to_sign = "GET\n/api/test\nexample.com;1234567890;abc123"
+        content = b'{"test": "data"}'
+        large_content = b"x" * (client.LARGE_CONTENT_SIZE + 1)
+
+        self.assertEqual(client.generate_signature(string_to_sign), self.client.generate_signature(string_to_sign))
+        self.assertEqual(client.calculate_content_hash(content), self.client.calculate_content_hash(content))
+        self.assertEqual(client.calculate_content_hash(large_content), self.client.calculate_content_hash(large_content))
+        self.assertEqual(client.calculate_content_hash(None), client.EMPTY_CONTENT_HASH)
+
+    def test_localhost_disables_warnings_once(self):
+        """Test that localhost clients disable SSL verification and only install the warning filter once"""
+        with patch.object(hmac_client, '_WARNINGS_DISABLED', False), \
+             patch('urllib3.disable_warnings') as disable_warnings:
+            first = HmacClient("test", "secret", "https://localhost:7134")
+            second = HmacClient("test", "secret", "https://127.0.0.1:7134")
+
+        self.assertFalse(first.session.verify)
+        self.assertFalse(second.session.verify)
+        disable_warnings.assert_called_once()
+
     def test_base_url_trailing_slash_removal(self):
         """Test that trailing slash is removed from base URL"""
         client = HmacClient("test", "secret", "https://api.example.com/")
         self.assertEqual(client.base_url, "https://api.example.com")
 
+    def test_is_openssl_sha256(self):
+        """Test OpenSSL backend detection"""
+        self.assertIsInstance(is_openssl_sha256(), bool)
+
+        with patch('hashlib.sha256', lambda data=b'': None):
+            self.assertFalse(is_openssl_sha256())
+
+    def test_create_authenticated_headers_base_path(self):
+        """Test that the base URL path and query string are signed"""
+        client = HmacClient("test", "secret", "https://api.example.com:8443/v1/")
+
+        with patch('time.time_ns', return_value=1234567890_123456789):
+            headers = client.create_authenticated_headers("GET", "/users?page=2")
+
+        self.assertEqual(headers["Host"], "api.example.com:8443")
+
+        string_to_sign = client.create_string_to_sign("GET", "/v1/users?page=2", [
+            "api.example.com:8443",
+            "1234567890",
+            client.EMPTY_CONTENT_HASH,
+            headers["x-nonce"]
+        ])
+        signature = client.generate_signature(string_to_sign)
+        self.assertTrue(headers["Authorization"].endswith("&Signature=" + signature))
+
+    def test_create_authenticated_headers_fragment(self):
+        """Test that a URL fragment is not part of the signed path"""
+        with patch('time.time_ns', return_value=1234567890_123456789), \
+             patch('uuid.uuid4', return_value="nonce"):
+            with_fragment = self.client.create_authenticated_headers("GET", "/api/test?x=1#section")
+            without_fragment = self.client.create_authenticated_headers("GET", "/api/test?x=1")
+
+        self.assertEqual(with_fragment["Authorization"], without_fragment["Authorization"])
+
+    def test_create_authenticated_headers_empty_query(self):
+        """Test that an empty trailing query string is not part of the signed path"""
+        with patch('time.time_ns', return_value=1234567890_123456789), \
+             patch('uuid.uuid4', return_value="nonce"):
+            empty_query = self.client.create_authenticated_headers("GET", "/api/test?")
+            empty_query_fragment = self.client.create_authenticated_headers("GET", "/api/test?#section")
+            without_query = self.client.create_authenticated_headers("GET", "/api/test")
+            with_query = self.client.create_authenticated_headers("GET", "/api/test??")
+            expected_query = self.client.create_string_to_sign("GET", "/api/test??", [
+                "api.example.com", "1234567890", self.client.EMPTY_CONTENT_HASH, "nonce"
+            ])
+
+        self.assertEqual(empty_query["Authorization"], without_query["Authorization"])
+        self.assertEqual(empty_query_fragment["Authorization"], without_query["Authorization"])
+
+        # A non-empty query ("?" here) is still signed, matching urlparse
+        self.assertTrue(with_query["Authorization"].endswith(
+            "&Signature=" + self.client.generate_signature(expected_query)
+        ))
+
+    def test_sign_input_helpers(self):
+        """Test that the active (compiled or fallback) helpers match the pure-Python ones"""
+        parts = [b"POST", b"/api/test?x=1", b"example.com", b"1234567890", b"abc=", b"nonce"]
+        expected = self.client.create_string_to_sign(
+            "POST", "/api/test?x=1", ["example.com", "1234567890", "abc=", "nonce"]
+        ).encode('utf-8')
+
+        self.assertEqual(hmac_client._build_sign_input_py(*parts), expected)
+        self.assertEqual(hmac_client._build_sign_input(*parts), expected)
+
+        digest = hashlib.sha256(b"data").digest()
+        self.assertEqual(hmac_client._b64_32(digest), base64.b64encode(digest))
+        self.assertEqual(hmac_client._b64_32_py(digest), base64.b64encode(digest))
+
     def test_create_string_to_sign(self):
         """Test string to sign creation"""
         method = "GET"
@@ -43,16 +221,14 @@ class TestHmacClient(unittest.TestCase):
 
     def test_generate_signature(self):
         """Test HMAC signature generation"""
-        string_to_sign = "GET\n/api/test\nexample.com;1234567890;abc123"
-        signature = self.client.generate_signature(string_to_sign)
+        signature = self.client.generate_signature(KAT_STRING_TO_SIGN)
+        self.assertEqual(signature, KAT_SIGNATURE)
 
-        # Signature should be base64 encoded
-        self.assertIsInstance(signature, str)
-        self.assertTrue(len(signature) > 0)
+        # Same input should produce same signature from the cached key state
+        self.assertEqual(self.client.generate_signature(KAT_STRING_TO_SIGN), KAT_SIGNATURE)
 
-        # Same input should produce same signature
-        signature2 = self.client.generate_signature(string_to_sign)
-        self.assertEqual(signature, signature2)
+        # Pre-encoded input should sign identically
+        self.assertEqual(self.client.generate_signature(KAT_STRING_TO_SIGN.encode('utf-8')), KAT_SIGNATURE)
 
     def test_generate_authorization_header(self):
         """Test authorization header generation"""
@@ -64,29 +240,35 @@ class TestHmacClient(unittest.TestCase):
 
         self.assertEqual(auth_header, expected)
 
+        auth_header = self.client.generate_authorization_header(self.client.DEFAULT_SIGNED_HEADERS, signature)
+        expected = "HMAC Client=TestClient&SignedHeaders=host;x-timestamp;x-content-sha256;x-nonce&Signature=test-signature"
+
+        self.assertEqual(auth_header, expected)
+
     def test_calculate_content_hash_empty(self):
         """Test content hash calculation for empty content"""
         hash_result = self.client.calculate_content_hash(None)
         self.assertEqual(hash_result, self.client.EMPTY_CONTENT_HASH)
 
-        hash_result = self.client.calculate_content_hash("")
+        hash_result = self.client.calculate_content_hash(b"")
         self.assertEqual(hash_result, self.client.EMPTY_CONTENT_HASH)
 
     def test_calculate_content_hash_with_content(self):
         """Test content hash calculation with actual content"""
-        content = '{"test": "data"}'
-        hash_result = self.client.calculate_content_hash(content)
+        hash_result = self.client.calculate_content_hash(KAT_CONTENT)
+        self.assertEqual(hash_result, KAT_CONTENT_HASH)
 
-        self.assertIsInstance(hash_result, str)
-        self.assertNotEqual(hash_result, self.client.EMPTY_CONTENT_HASH)
+    def test_calculate_content_hash_large_content(self):
+        """Test chunked content hash calculation for large content"""
+        content = b"x" * (self.client.LARGE_CONTENT_SIZE + self.client.HASH_CHUNK_SIZE // 2)
+        hash_result = self.client.calculate_content_hash(content)
 
-        # Same content should produce same hash
-        hash_result2 = self.client.calculate_content_hash(content)
-        self.assertEqual(hash_result, hash_result2)
+        expected = base64.b64encode(hashlib.sha256(content).digest()).decode('ascii')
+        self.assertEqual(hash_result, expected)
 
     def test_create_authenticated_headers(self):
         """Test authenticated headers creation"""
-        with patch('time.time', return_value=1234567890):
+        with patch('time.time_ns', return_value=1234567890_123456789):
             headers = self.client.create_authenticated_headers("GET", "/api/test")
 
             self.assertIn("Host", headers)
@@ -98,62 +280,75 @@ class TestHmacClient(unittest.TestCase):
             self.assertEqual(headers["x-timestamp"], "1234567890")
             self.assertEqual(headers["x-content-sha256"], self.client.EMPTY_CONTENT_HASH)
             self.assertTrue(headers["Authorization"].startswith("HMAC Client=TestClient"))
+            self.assertNotIn("Content-Type", headers)
+
+            # The shared headers template must not be modified
+            self.assertEqual(self.client._headers_tpl[self.client.TIME_STAMP_HEADER_NAME], "")
 
     def test_create_authenticated_headers_with_content(self):
         """Test authenticated headers creation with content"""
-        content = '{"test": "data"}'
+        content = b'{"test": "data"}'
 
-        with patch('time.time', return_value=1234567890):
+        with patch('time.time_ns', return_value=1234567890_123456789):
             headers = self.client.create_authenticated_headers("POST", "/api/test", content)
 
             self.assertIn("Content-Type", headers)
             self.assertEqual(headers["Content-Type"], "application/json")
             self.assertNotEqual(headers["x-content-sha256"], self.client.EMPTY_CONTENT_HASH)
 
-    @patch('requests.Session.request')
-    def test_request_method(self, mock_request):
+    def test_create_authenticated_headers_known_answer(self):
+        """Test authenticated headers against a known-answer vector"""
+        with patch('time.time_ns', return_value=1234567890_123456789), \
+             patch('uuid.uuid4', return_value=KAT_NONCE):
+            headers = self.client.create_authenticated_headers("POST", "/api/test", b'{"key":"value"}')
+
+        self.assertEqual(headers, {
+            "Host": "api.example.com",
+            "x-timestamp": "1234567890",
+            "x-content-sha256": KAT_POST_CONTENT_HASH,
+            "x-nonce": KAT_NONCE,
+            "Authorization": "HMAC Client=TestClient&SignedHeaders=host;x-timestamp;x-content-sha256;x-nonce"
+                             "&Signature=" + KAT_POST_SIGNATURE,
+            "Content-Type": "application/json"
+        })
+
+    def test_request_method(self):
         """Test generic request method"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_request.return_value = mock_response
-
         response = self.client.request("GET", "/api/test")
 
-        self.assertEqual(response, mock_response)
-        mock_request.assert_called_once()
+        self.assertIsInstance(response, _StubResponse)
+        self.assertEqual(self.client.session.calls, 1)
 
         # Verify the call arguments
-        call_args = mock_request.call_args
-        self.assertEqual(call_args[1]['method'], "GET")
-        self.assertEqual(call_args[1]['url'], "https://api.example.com/api/test")
-        self.assertIn('headers', call_args[1])
+        last = self.client.session.last
+        self.assertEqual(last['method'], "GET")
+        self.assertEqual(last['url'], "https://api.example.com/api/test")
+        self.assertIn('headers', last)
 
-    @patch('requests.Session.request')
-    def test_get_method(self, mock_request):
+    def test_get_method(self):
         """Test GET convenience method"""
-        mock_response = Mock()
-        mock_request.return_value = mock_response
+        self.client.get("/api/test")
 
-        response = self.client.get("/api/test")
+        self.assertEqual(self.client.session.calls, 1)
+        last = self.client.session.last
+        self.assertEqual(last['method'], "GET")
+        self.assertIsNone(last['data'])
 
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        self.assertEqual(call_args[1]['method'], "GET")
-        self.assertIsNone(call_args[1]['data'])
-
-    @patch('requests.Session.request')
-    def test_post_method(self, mock_request):
+    def test_post_method(self):
         """Test POST convenience method"""
-        mock_response = Mock()
-        mock_request.return_value = mock_response
-
         test_data = {"key": "value"}
-        response = self.client.post("/api/test", test_data)
-
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        self.assertEqual(call_args[1]['method'], "POST")
-        self.assertIn('"key": "value"', call_args[1]['data'])
+        with patch('time.time_ns', return_value=1234567890_123456789), \
+             patch('uuid.uuid4', return_value=KAT_NONCE):
+            self.client.post("/api/test", test_data)
+
+        self.assertEqual(self.client.session.calls, 1)
+        last = self.client.session.last
+        self.assertEqual(last['method'], "POST")
+        self.assertEqual(last['data'], b'{"key":"value"}')
+
+        # Hash must cover exactly the bytes sent on the wire
+        self.assertEqual(last['headers']['x-content-sha256'], KAT_POST_CONTENT_HASH)
+        self.assertTrue(last['headers']['Authorization'].endswith("&Signature=" + KAT_POST_SIGNATURE))
 
 
 class TestHmacClientIntegration(unittest.TestCase):